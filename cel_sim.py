@@ -6,12 +6,9 @@ def main() -> None:
     config = Configuration()
     config.interactive_setup()  # user can change parameters
     
-    # 2. Build and run the simulation
+    # 2. Build and run the simulation (run() displays the final statistics)
     sim = Simulation(config)
     sim.run()
-    
-    # 3. Display final simulation statistics
-    sim.report()
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -11,12 +11,63 @@ Manages the simulation parameters:
   - division_cooldown: Minimum ticks between divisions (≥ 1)
   - time_limit: Simulation duration in ticks (≥ 1)
   - visualisation_enabled: Whether to display the simulation graphically (True/False)
+  - visualisation_every_n_ticks: Refresh the display at most every n ticks (≥ 1)
+  - seed: Seed for the simulation's random number generator (integer ≥ 0, or None for a fresh seed)
+
+Setting quiet (True/False, not reset by reset_defaults) suppresses status
+messages, e.g. for batch runs; the interactive menus are unaffected.
 """
 
+import functools
+
+@functools.lru_cache(maxsize=128)
+def _validate_tuple(params: tuple) -> None:
+    """
+    Validates a tuple of (type, value) pairs as returned by Configuration._params().
+    Only successful validations are cached, since a raised error is not. Keying on
+    the types as well as the values keeps equal values of different types (e.g. 1
+    and 1.0) from sharing a cached result.
+
+    Raises:
+        ValueError: If any parameter does not meet its constraint.
+    """
+    (grid_rows, grid_cols, initial_population, age_limit,
+     division_limit, division_probability, division_cooldown, time_limit,
+     visualisation_every_n_ticks, seed) = (value for _, value in params)
+    if grid_rows < 3:
+        raise ValueError("Grid rows must be at least 3.")
+    if grid_cols < 3:
+        raise ValueError("Grid columns must be at least 3.")
+    if initial_population < 1:
+        raise ValueError("Initial population must be at least 1.")
+    if initial_population > grid_rows * grid_cols:
+        raise ValueError("Initial population cannot exceed total number of patches "
+                         f"({grid_rows * grid_cols}).")
+    if age_limit < 1:
+        raise ValueError("Age limit must be at least 1.")
+    if division_limit < 1:
+        raise ValueError("Division limit must be at least 1.")
+    if not (0 <= division_probability <= 1):
+        raise ValueError("Division probability must be between 0 and 1.")
+    if division_cooldown < 1:
+        raise ValueError("Division cooldown must be at least 1.")
+    if time_limit < 1:
+        raise ValueError("Time limit must be at least 1.")
+    if visualisation_every_n_ticks < 1:
+        raise ValueError("Visualisation interval must be at least 1.")
+    if seed is not None and (not isinstance(seed, int) or seed < 0):
+        raise ValueError("Seed must be a non-negative integer or None.")
+
 class Configuration:
-    def __init__(self) -> None:
+    def __init__(self, quiet: bool = False) -> None:
+        self.quiet = quiet
         self.reset_defaults()
 
+    def log(self, message: str) -> None:
+        """Prints a status message unless quiet mode is on. Used for all status output."""
+        if not self.quiet:
+            print(message)
+
     def reset_defaults(self) -> None:
         """Resets all configuration parameters to their default values."""
         self.grid_rows = 15
@@ -28,7 +79,9 @@ class Configuration:
         self.division_cooldown = 2
         self.time_limit = 100
         self.visualisation_enabled = True
-        print("\nConfiguration has been reset to default values.")
+        self.visualisation_every_n_ticks = 1
+        self.seed = None
+        self.log("\nConfiguration has been reset to default values.")
 
     def display(self) -> None:
         """Displays the current configuration parameters."""
@@ -43,8 +96,17 @@ class Configuration:
         print(f"7. Division cooldown (ticks): {self.division_cooldown}")
         print(f"8. Simulation time limit    : {self.time_limit}")
         print(f"9. Visualisation enabled    : {self.visualisation_enabled}")
+        print(f"10. Visualisation interval  : {self.visualisation_every_n_ticks}")
+        print(f"11. Random seed             : {self.seed}")
         print("-" * 40)
 
+    def _params(self) -> tuple:
+        """Returns the validated parameters as a hashable tuple of (type, value) pairs."""
+        values = (self.grid_rows, self.grid_cols, self.initial_population, self.age_limit,
+                  self.division_limit, self.division_probability, self.division_cooldown,
+                  self.time_limit, self.visualisation_every_n_ticks, self.seed)
+        return tuple((type(value), value) for value in values)
+
     def validate(self) -> None:
         """
         Validates the configuration parameters.
@@ -52,25 +114,7 @@ class Configuration:
         Raises:
             ValueError: If any parameter does not meet its constraint.
         """
-        if self.grid_rows < 3:
-            raise ValueError("Grid rows must be at least 3.")
-        if self.grid_cols < 3:
-            raise ValueError("Grid columns must be at least 3.")
-        if self.initial_population < 1:
-            raise ValueError("Initial population must be at least 1.")
-        if self.initial_population > self.grid_rows * self.grid_cols:
-            raise ValueError("Initial population cannot exceed total number of patches "
-                             f"({self.grid_rows * self.grid_cols}).")
-        if self.age_limit < 1:
-            raise ValueError("Age limit must be at least 1.")
-        if self.division_limit < 1:
-            raise ValueError("Division limit must be at least 1.")
-        if not (0 <= self.division_probability <= 1):
-            raise ValueError("Division probability must be between 0 and 1.")
-        if self.division_cooldown < 1:
-            raise ValueError("Division cooldown must be at least 1.")
-        if self.time_limit < 1:
-            raise ValueError("Time limit must be at least 1.")
+        _validate_tuple(self._params())
 
     def interactive_setup(self) -> None:
         """
@@ -101,7 +145,7 @@ class Configuration:
                 self.reset_defaults()
             elif choice == "4":
                 print("Exiting program. Goodbye!")
-                exit(0)
+                raise SystemExit(0)
             else:
                 print("Invalid option. Please choose a number between 1 and 4.")
 
@@ -121,9 +165,11 @@ class Configuration:
             print("g. Set division cooldown (ticks)")
             print("h. Set simulation time limit (ticks)")
             print("i. Toggle visualisation enabled")
+            print("j. Set visualisation interval (ticks)")
+            print("k. Set random seed")
             print("x. Return to main menu")
 
-            option = input("Enter your option [a-i or x]: ").strip().lower()
+            option = input("Enter your option [a-k or x]: ").strip().lower()
             if option == "a":
                 self.grid_rows = self._prompt_int("Enter number of grid rows (≥ 3): ", 3)
             elif option == "b":
@@ -147,6 +193,14 @@ class Configuration:
             elif option == "i":
                 self.visualisation_enabled = not self.visualisation_enabled
                 print(f"Visualisation enabled set to: {self.visualisation_enabled}")
+            elif option == "j":
+                self.visualisation_every_n_ticks = self._prompt_int("Enter visualisation interval in ticks (≥ 1): ", 1)
+            elif option == "k":
+                if input("Use a fixed random seed? [y/n]: ").strip().lower() == "y":
+                    self.seed = self._prompt_int("Enter random seed (≥ 0): ", 0)
+                else:
+                    self.seed = None
+                print(f"Random seed set to: {self.seed}")
             elif option == "x":
                 print("Returning to main menu...")
                 break
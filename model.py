@@ -16,6 +16,8 @@ from typing import Optional
 
 class Patch:
   """Represents a 'patch' at the intersection of the riven row and column of the simulation grid."""
+
+  __slots__ = ("_col", "_row", "_cell")
   
   def __init__(self:Patch,row:int,col:int):
     """    
@@ -64,6 +66,8 @@ class Patch:
 class Cell:
   """Represents a cell in the simulation."""
 
+  __slots__ = ("_patch", "_age", "_divisions", "_last_division", "_alive")
+
   def __init__(self:Cell,patch:Patch):
     """    
     Parameters
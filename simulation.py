@@ -1,9 +1,126 @@
-import random
-import time
+"""
+This module provides Simulation, the class that runs the cell simulation on a toroidal grid of patches.
+
+Requirements
+------------
+Package numpy https://numpy.org/ which can be installed via PIP.
+Package numba https://numba.pydata.org/ which can be installed via PIP. It is optional:
+with it each tick runs as a compiled kernel, without it a NumPy implementation is used.
+Python 3.7 or higher.
+"""
+
+import numpy as np
 from model import Patch, Cell
 from visualiser import Visualiser
 from config import Configuration
 
+try:
+    from numba import njit, config as numba_config
+    # Under NUMBA_DISABLE_JIT the kernel would run as plain Python, slower than the NumPy path.
+    USE_NUMBA = not numba_config.DISABLE_JIT
+except ImportError:  # numba is optional: ticks then use the NumPy implementation
+    USE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# (row, col) offsets of the 8 patches surrounding a patch.
+NEIGHBOR_OFFSETS = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if (dr, dc) != (0, 0)]
+
+# Death cause bit flags; a cell may die of several causes in the same tick.
+DEATH_BY_AGE = 1
+DEATH_BY_DIVISION_LIMIT = 2
+DEATH_BY_OVERCROWDING = 4
+_CAUSE_CODES = np.arange(8)
+
+
+@njit(cache=True, boundscheck=False)
+def _tick_kernel(live, divides, picks, ties, crowded, alive, pending, ages, divisions, last_div,
+                 nbr_flat, age_limit, division_limit, division_cooldown, causes, births):
+    """
+    Runs one tick as a single pass over the cells alive at its start (flat indices, in
+    raster order): each cell is aged, checked against the age and division limits and
+    then attempts division or detects overcrowding. State arrays and death cause flags
+    are mutated in place.
+
+    Neighbours later in the pass have not been aged yet when a cell inspects them, so
+    pending marks the cells still to be aged and their age counts one tick higher when
+    looking for the oldest cells of an overcrowded region. The outcome is the same as
+    ageing every cell before any division.
+
+    divides, picks and ties hold each cell's pre-drawn division coin, target choice and
+    overcrowding tie-break (uniform in [0, 1)). The flat indices of newborn cells are
+    written to births; returns how many there are.
+    """
+    num_births = 0
+    for k in range(live.shape[0]):
+        i = live[k]
+        ages[i] += 1
+        last_div[i] += 1
+        pending[i] = False
+        if ages[i] >= age_limit:
+            causes[i] |= DEATH_BY_AGE
+        if divisions[i] >= division_limit:
+            causes[i] |= DEATH_BY_DIVISION_LIMIT
+        if causes[i]:  # dying this tick, possibly by a neighbour's overcrowding
+            continue
+        if last_div[i] < division_cooldown:
+            continue
+        num_empty = 0
+        if not crowded[i]:
+            for j in range(nbr_flat.shape[1]):
+                if not alive[nbr_flat[i, j]]:
+                    num_empty += 1
+        if num_empty > 0:
+            if divides[k]:
+                # The target is chosen among patches that are empty right now and is marked
+                # alive immediately, so dividing cells can never collide on a target.
+                choice = int(picks[k] * num_empty)
+                target = -1
+                for j in range(nbr_flat.shape[1]):
+                    if not alive[nbr_flat[i, j]]:
+                        if choice == 0:
+                            target = nbr_flat[i, j]
+                            break
+                        choice -= 1
+                alive[target] = True
+                ages[target] = 0
+                divisions[target] = 0
+                last_div[target] = 0
+                births[num_births] = target
+                num_births += 1
+                last_div[i] = 0
+                divisions[i] += 1
+                if divisions[i] >= division_limit:
+                    causes[i] |= DEATH_BY_DIVISION_LIMIT
+        else:
+            # Overcrowding: a random one of the oldest cells in the 3×3 region dies.
+            max_age = ages[i]
+            num_oldest = 1
+            for j in range(nbr_flat.shape[1]):
+                n = nbr_flat[i, j]
+                if alive[n]:
+                    age = (ages[n] + 1) if pending[n] else ages[n]
+                    if age > max_age:
+                        max_age = age
+                        num_oldest = 1
+                    elif age == max_age:
+                        num_oldest += 1
+            choice = int(ties[k] * num_oldest)
+            victim = i
+            if ages[i] == max_age:
+                choice -= 1
+            if choice >= 0:
+                for j in range(nbr_flat.shape[1]):
+                    n = nbr_flat[i, j]
+                    if alive[n] and ((ages[n] + 1) if pending[n] else ages[n]) == max_age:
+                        if choice == 0:
+                            victim = n
+                            break
+                        choice -= 1
+            causes[victim] |= DEATH_BY_OVERCROWDING
+    return num_births
+
 class Simulation:
     """
     Manages the simulation lifecycle:
@@ -12,24 +129,64 @@ class Simulation:
       - Processes simulation ticks (aging, division, death, overcrowding).
       - Updates the visualiser if enabled.
       - Reports statistics at the end.
+
+    Cell state is kept as NumPy arrays indexed by flat patch index
+    (row * grid_cols + col); the Cell objects placed on patches only mark
+    occupancy for the visualiser. They are never ticked or divided, so their
+    age(), divisions() and last_division() always return 0: read the ages,
+    divisions and last_div arrays instead.
     """
+    __slots__ = (
+        "config", "rng", "patches_flat",
+        "alive", "ages", "divisions", "last_div", "occ", "nbr_flat",
+        "_causes", "_births", "_pending",
+        "current_tick", "total_cells_created", "total_deaths", "alive_count",
+        "deaths_by_age", "deaths_by_division_limit", "deaths_by_overcrowding",
+        "_dirty", "visualiser",
+    )
+
     def __init__(self, config: Configuration) -> None:
         self.config = config
         self.config.validate()
+        # Single generator for all randomness, seeded from the configuration for reproducible runs.
+        self.rng = np.random.default_rng(self.config.seed)
 
         # Ensure minimum grid size
         assert self.config.grid_rows >= 3 and self.config.grid_cols >= 3, "Grid size must be at least 3x3."
 
-        # Create a 2D grid of Patch objects.
-        self.grid = [
-            [Patch(row, col) for col in range(self.config.grid_cols)]
+        # Create the grid of Patch objects as a flat, row-major list.
+        self.patches_flat = [
+            Patch(row, col)
             for row in range(self.config.grid_rows)
+            for col in range(self.config.grid_cols)
         ]
 
+        # Per-patch cell state.
+        num_patches = self.config.grid_rows * self.config.grid_cols
+        self.alive = np.zeros(num_patches, dtype=bool)
+        self.ages = np.zeros(num_patches, dtype=np.int32)
+        self.divisions = np.zeros(num_patches, dtype=np.int32)
+        self.last_div = np.zeros(num_patches, dtype=np.int32)
+        # Occupancy grid (1 = patch holds a live cell) sharing storage with self.alive.
+        self.occ = self.alive.view(np.uint8).reshape(self.config.grid_rows, self.config.grid_cols)
+        # Toroidal neighbour lookup table: nbr_flat[i] holds the flat indices of the 8 neighbours.
+        rows = np.arange(self.config.grid_rows)[:, None]
+        cols = np.arange(self.config.grid_cols)[None, :]
+        self.nbr_flat = np.stack(
+            [((rows + dr) % self.config.grid_rows) * self.config.grid_cols + (cols + dc) % self.config.grid_cols
+             for dr, dc in NEIGHBOR_OFFSETS],
+            axis=-1
+        ).reshape(num_patches, len(NEIGHBOR_OFFSETS))
+        # Scratch buffers reused by every tick.
+        self._causes = np.zeros(num_patches, dtype=np.uint8)
+        self._births = np.empty(num_patches, dtype=np.intp)
+        self._pending = np.zeros(num_patches, dtype=bool)
+
         # Simulation statistics.
         self.current_tick = 0
         self.total_cells_created = 0
         self.total_deaths = 0
+        self.alive_count = 0
         self.deaths_by_age = 0
         self.deaths_by_division_limit = 0
         self.deaths_by_overcrowding = 0
@@ -38,11 +195,11 @@ class Simulation:
         self._seed_initial_cells()
 
         # Initialize the visualiser if enabled.
+        self._dirty = True  # whether the grid changed since the last visualiser update
         self.visualiser = None
         if self.config.visualisation_enabled:
-            patches_flat = [patch for row in self.grid for patch in row]
             self.visualiser = Visualiser(
-                patches=patches_flat,
+                patches=self.patches_flat,
                 rows=self.config.grid_rows,
                 cols=self.config.grid_cols,
                 grid_lines=True,
@@ -52,147 +209,166 @@ class Simulation:
 
     def _seed_initial_cells(self) -> None:
         """Randomly places the initial cell population on empty patches."""
-        positions = [(r, c) for r in range(self.config.grid_rows)
-                     for c in range(self.config.grid_cols)]
-        random.shuffle(positions)
-        for _ in range(self.config.initial_population):
-            if not positions:
-                break
-            r, c = positions.pop()
-            patch = self.grid[r][c]
-            Cell(patch)
+        # Sampling distinct flat indices avoids building and shuffling every position.
+        positions = self.rng.choice(len(self.patches_flat), self.config.initial_population, replace=False)
+        for index in positions.tolist():
+            self._place_cell(index)
             self.total_cells_created += 1
+            self.alive_count += 1
+
+    def _place_cell(self, index: int) -> None:
+        """Creates a new cell on the empty patch with the given flat index."""
+        Cell(self.patches_flat[index])  # occupancy marker only; its own state is not maintained
+        self.alive[index] = True
+        self.ages[index] = 0
+        self.divisions[index] = 0
+        self.last_div[index] = 0
 
     def run(self) -> None:
         """Runs the simulation until the time limit is reached or all cells are dead."""
-        print("Starting simulation...")
+        self.config.log("Starting simulation...")
         while self.current_tick < self.config.time_limit:
             if self._all_cells_dead():
-                print("All cells have died. Ending simulation early.")
+                self.config.log("All cells have died. Ending simulation early.")
                 break
 
             self._simulate_tick()
             self.current_tick += 1
 
-            if self.visualiser:
+            if (self.visualiser and self._dirty
+                    and self.current_tick % self.config.visualisation_every_n_ticks == 0):
                 self.visualiser.update()
+                self._dirty = False
+
+        if self.visualiser and self._dirty:
+            self.visualiser.update()
 
-        print("Simulation finished.")
-        self.report()  # <-- Now calls the public report() method
+        self.config.log("Simulation finished.")
+        if not self.config.quiet:
+            self.report()
 
     def _simulate_tick(self) -> None:
         """
         Processes one simulation tick:
-          1. Ages each cell.
-          2. Schedules cell deaths (by age or division limit).
-          3. Attempts cell divisions.
-          4. Handles overcrowding.
-          5. Applies scheduled cell deaths.
+          1. Ages each cell and schedules its death by age or division limit.
+          2. Attempts its division, or handles overcrowding around it.
+          3. Applies scheduled cell deaths.
+        With Numba, steps 1 and 2 run as a single fused pass over the living cells (see
+        _tick_kernel); the fusion only pays off when compiled, so without Numba they run
+        as array operations followed by a pass over the division candidates (see _numpy_tick).
+        """
+        config = self.config
+        alive = self.alive
+        rng = self.rng
+        patches_flat = self.patches_flat
+
+        causes = self._causes
+        causes.fill(0)
+        # Occupancy only grows until deaths are applied, so a full neighbourhood stays full
+        # and crowded cells need no per-cell probe.
+        crowded = self._neighbor_counts().ravel() == len(NEIGHBOR_OFFSETS)
+        live = np.flatnonzero(alive)
+        num_live = len(live)
+        # Draw every cell's random numbers in bulk, outside the kernel.
+        divides = rng.random(num_live) < config.division_probability
+        picks = rng.random(num_live)
+        ties = rng.random(num_live)
+        births = self._births
+        if USE_NUMBA:
+            pending = self._pending
+            np.copyto(pending, alive)
+            num_births = _tick_kernel(live, divides, picks, ties, crowded, alive, pending, self.ages,
+                                      self.divisions, self.last_div, self.nbr_flat, config.age_limit,
+                                      config.division_limit, config.division_cooldown, causes, births)
+        else:
+            num_births = self._numpy_tick(live, divides, picks, ties, crowded, causes, births)
+        for i in births[:num_births].tolist():
+            Cell(patches_flat[i])  # occupancy marker only, see the class docstring
+        self.total_cells_created += num_births
+        self.alive_count += num_births
+
+        # 3. Apply scheduled cell deaths.
+        dying = causes != 0
+        for i in np.flatnonzero(dying).tolist():
+            patches_flat[i].cell().die()
+        alive[dying] = False
+        if num_births or dying.any():
+            self._dirty = True
+        # Tally deaths per combination of causes in a single pass.
+        tally = np.bincount(causes, minlength=len(_CAUSE_CODES))
+        num_deaths = int(tally[1:].sum())
+        self.total_deaths += num_deaths
+        self.alive_count -= num_deaths
+        self.deaths_by_age += int(tally[(_CAUSE_CODES & DEATH_BY_AGE) != 0].sum())
+        self.deaths_by_division_limit += int(tally[(_CAUSE_CODES & DEATH_BY_DIVISION_LIMIT) != 0].sum())
+        self.deaths_by_overcrowding += int(tally[(_CAUSE_CODES & DEATH_BY_OVERCROWDING) != 0].sum())
+
+    def _numpy_tick(self, live: np.ndarray, divides: np.ndarray, picks: np.ndarray, ties: np.ndarray,
+                    crowded: np.ndarray, causes: np.ndarray, births: np.ndarray) -> int:
+        """
+        NumPy counterpart of _tick_kernel, used when Numba is not available. Takes the same
+        arguments and gives the same result, but ages and checks the limits of all cells
+        with array operations before visiting the division candidates one by one.
+        """
+        config = self.config
+        division_limit = config.division_limit
+        alive, ages, divisions, last_div = self.alive, self.ages, self.divisions, self.last_div
+        nbr_flat = self.nbr_flat
+
+        ages[live] += 1
+        last_div[live] += 1
+        causes[live[ages[live] >= config.age_limit]] |= DEATH_BY_AGE
+        causes[live[divisions[live] >= division_limit]] |= DEATH_BY_DIVISION_LIMIT
+        candidates = np.flatnonzero((causes[live] == 0) & (last_div[live] >= config.division_cooldown))
+
+        live, divides, picks, ties = live.tolist(), divides.tolist(), picks.tolist(), ties.tolist()
+        num_births = 0
+        for k in candidates.tolist():
+            i = live[k]
+            if causes[i]:  # already doomed by a neighbour's overcrowding
+                continue
+            neighbors = nbr_flat[i]
+            if crowded[i]:
+                empty = ()
+            else:
+                empty = neighbors[~alive[neighbors]]
+            if len(empty):
+                if divides[k]:
+                    target = empty[int(picks[k] * len(empty))]
+                    alive[target] = True
+                    ages[target] = divisions[target] = last_div[target] = 0
+                    births[num_births] = target
+                    num_births += 1
+                    last_div[i] = 0
+                    divisions[i] += 1
+                    if divisions[i] >= division_limit:
+                        causes[i] |= DEATH_BY_DIVISION_LIMIT
+            else:
+                # Overcrowding: all 8 neighbours are occupied; a random one of the oldest
+                # cells in the 3×3 region (centre first, then neighbours in order) dies.
+                neighbor_ages = ages[neighbors]
+                max_age = max(ages[i], neighbor_ages.max())
+                oldest = neighbors[neighbor_ages == max_age].tolist()
+                if ages[i] == max_age:
+                    oldest.insert(0, i)
+                causes[oldest[int(ties[k] * len(oldest))]] |= DEATH_BY_OVERCROWDING
+        return num_births
+
+    def _neighbor_counts(self) -> np.ndarray:
+        """
+        Returns the number of occupied patches in the 8-neighbourhood of every patch,
+        i.e. a wrap-around 3×3 convolution of the occupancy grid excluding the centre.
         """
-        cells_to_die = {}  # Mapping: Patch -> set of death causes
-        births = []        # List of tuples (target_patch, new_cell)
-
-        # 1. Age all cells.
-        for row in self.grid:
-            for patch in row:
-                if patch.has_cell():
-                    cell = patch.cell()
-                    if cell.is_alive():
-                        cell.tick()
-
-        # 2. Schedule deaths due to age or division limit.
-        for row in self.grid:
-            for patch in row:
-                if patch.has_cell():
-                    cell = patch.cell()
-                    if not cell.is_alive():
-                        continue
-                    if cell.age() >= self.config.age_limit:
-                        cells_to_die.setdefault(patch, set()).add("age")
-                    if cell.divisions() >= self.config.division_limit:
-                        cells_to_die.setdefault(patch, set()).add("division_limit")
-
-        # 3. Attempt cell divisions.
-        for r in range(self.config.grid_rows):
-            for c in range(self.config.grid_cols):
-                patch = self.grid[r][c]
-                if patch.has_cell():
-                    cell = patch.cell()
-                    if not cell.is_alive():
-                        continue
-                    if patch in cells_to_die:
-                        continue
-                    if cell.last_division() < self.config.division_cooldown:
-                        continue
-                    empty_neighbors = self._empty_neighbors(r, c)
-                    if empty_neighbors:
-                        if random.random() < self.config.division_probability:
-                            target_r, target_c = random.choice(empty_neighbors)
-                            target_patch = self.grid[target_r][target_c]
-                            new_cell = cell.divide(target_patch)
-                            births.append((target_patch, new_cell))
-                            self.total_cells_created += 1
-                            if cell.divisions() >= self.config.division_limit:
-                                cells_to_die.setdefault(patch, set()).add("division_limit")
-                    else:
-                        # Overcrowding: no empty neighbor.
-                        self._handle_overcrowding(r, c, cells_to_die)
-
-        # 4. Apply scheduled cell deaths.
-        for patch, causes in cells_to_die.items():
-            if patch.has_cell():
-                cell = patch.cell()
-                if cell.is_alive():
-                    cell.die()
-                    self.total_deaths += 1
-                    if "age" in causes:
-                        self.deaths_by_age += 1
-                    if "division_limit" in causes:
-                        self.deaths_by_division_limit += 1
-                    if "overcrowding" in causes:
-                        self.deaths_by_overcrowding += 1
-
-    def _empty_neighbors(self, row: int, col: int) -> list:
-        """Returns a list of (row, col) coordinates for empty patches adjacent to (row, col)."""
-        empty = []
-        for dr in (-1, 0, 1):
-            for dc in (-1, 0, 1):
-                if dr == 0 and dc == 0:
-                    continue
-                nr = (row + dr) % self.config.grid_rows
-                nc = (col + dc) % self.config.grid_cols
-                if not self.grid[nr][nc].has_cell():
-                    empty.append((nr, nc))
-        return empty
-
-    def _handle_overcrowding(self, row: int, col: int, cells_to_die: dict) -> None:
-        """Handles death by overcrowding in a 3×3 region."""
-        region_coords = []
-        for dr in (-1, 0, 1):
-            for dc in (-1, 0, 1):
-                nr = (row + dr) % self.config.grid_rows
-                nc = (col + dc) % self.config.grid_cols
-                region_coords.append((nr, nc))
-        region_cells = []
-        for r, c in region_coords:
-            patch = self.grid[r][c]
-            if patch.has_cell():
-                cell = patch.cell()
-                if cell.is_alive():
-                    region_cells.append((patch, cell.age()))
-        if region_cells:
-            max_age = max(age for (_, age) in region_cells)
-            oldest_patches = [patch for (patch, age) in region_cells if age == max_age]
-            target_patch = random.choice(oldest_patches)
-            cells_to_die.setdefault(target_patch, set()).add("overcrowding")
+        rows, cols = self.occ.shape
+        padded = np.pad(self.occ, 1, mode="wrap")
+        counts = np.zeros_like(self.occ)
+        for dr, dc in NEIGHBOR_OFFSETS:
+            counts += padded[1 + dr:1 + dr + rows, 1 + dc:1 + dc + cols]
+        return counts
 
     def _all_cells_dead(self) -> bool:
         """Returns True if no living cells remain in the grid."""
-        for row in self.grid:
-            for patch in row:
-                if patch.has_cell() and patch.cell().is_alive():
-                    return False
-        return True
+        return self.alive_count == 0
 
     def report(self) -> None:
         """Displays the final simulation statistics."""
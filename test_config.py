@@ -0,0 +1,68 @@
+"""
+Tests for the config module.
+
+Run with ``python -m unittest`` or ``python -m pytest`` from the repository root.
+"""
+
+import unittest
+from config import Configuration, _validate_tuple
+
+
+def make_config() -> Configuration:
+    """Returns a quiet configuration with default values."""
+    return Configuration(quiet=True)
+
+
+class ValidateTest(unittest.TestCase):
+
+    def setUp(self):
+        _validate_tuple.cache_clear()
+
+    def test_defaults_are_valid(self):
+        make_config().validate()
+
+    def test_visualisation_interval_must_be_positive(self):
+        config = make_config()
+        config.visualisation_every_n_ticks = 0
+        with self.assertRaises(ValueError):
+            config.validate()
+        config.visualisation_every_n_ticks = 5
+        config.validate()
+
+    def test_seed_rule(self):
+        config = make_config()
+        for seed in (None, 0, 42):
+            config.seed = seed
+            config.validate()
+        for seed in (-1, 1.5, "abc"):
+            config.seed = seed
+            with self.assertRaises(ValueError, msg=f"seed={seed!r}"):
+                config.validate()
+
+    def test_cache_does_not_accept_equal_but_invalid_values(self):
+        """A cached success must not be reused for an equal value that is invalid."""
+        config = make_config()
+        config.seed = 1
+        config.validate()
+        config.seed = 1.0
+        with self.assertRaises(ValueError):
+            config.validate()
+
+    def test_invalid_result_is_not_cached(self):
+        config = make_config()
+        config.grid_rows = 2
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                config.validate()
+        config.grid_rows = 3
+        config.validate()
+
+    def test_repeat_validation_hits_cache(self):
+        config = make_config()
+        config.validate()
+        config.validate()
+        self.assertEqual(_validate_tuple.cache_info().hits, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
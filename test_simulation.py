@@ -0,0 +1,103 @@
+"""
+Tests for the simulation module.
+
+Run with ``python -m unittest`` or ``python -m pytest`` from the repository root.
+"""
+
+import unittest
+import numpy as np
+import simulation
+from config import Configuration
+from simulation import (Simulation, DEATH_BY_AGE, DEATH_BY_DIVISION_LIMIT,
+                        DEATH_BY_OVERCROWDING)
+
+
+def reference_tick(live, divides, picks, ties, alive, ages, divisions, last_div, nbr_flat,
+                   age_limit, division_limit, division_cooldown):
+    """
+    Step-by-step tick as described in the project: age every cell, schedule deaths by age
+    and division limit, then attempt divisions (or detect overcrowding) cell by cell in
+    raster order. Mutates the state arrays and returns the death cause flags.
+    """
+    causes = np.zeros(len(alive), dtype=np.uint8)
+    ages[live] += 1
+    last_div[live] += 1
+    causes[live[ages[live] >= age_limit]] |= DEATH_BY_AGE
+    causes[live[divisions[live] >= division_limit]] |= DEATH_BY_DIVISION_LIMIT
+    for k, i in enumerate(live):
+        if causes[i] or last_div[i] < division_cooldown:
+            continue
+        empty = [n for n in nbr_flat[i] if not alive[n]]
+        if empty:
+            if divides[k]:
+                target = empty[int(picks[k] * len(empty))]
+                alive[target] = True
+                ages[target] = divisions[target] = last_div[target] = 0
+                last_div[i] = 0
+                divisions[i] += 1
+                if divisions[i] >= division_limit:
+                    causes[i] |= DEATH_BY_DIVISION_LIMIT
+        else:
+            region = [n for n in [i, *nbr_flat[i]] if alive[n]]
+            max_age = max(ages[n] for n in region)
+            oldest = [n for n in region if ages[n] == max_age]
+            causes[oldest[int(ties[k] * len(oldest))]] |= DEATH_BY_OVERCROWDING
+    return causes
+
+
+class TickKernelTest(unittest.TestCase):
+
+    def setUp(self):
+        use_numba = simulation.USE_NUMBA
+        self.addCleanup(setattr, simulation, "USE_NUMBA", use_numba)
+
+    def test_fused_tick_matches_reference(self):
+        """The fused single-pass kernel gives the same state as the step-by-step tick."""
+        # Run as plain Python when Numba is missing; correct, only slower.
+        simulation.USE_NUMBA = True
+        self.check_against_reference()
+
+    def test_numpy_tick_matches_reference(self):
+        """The NumPy tick used without Numba gives the same state as the step-by-step tick."""
+        simulation.USE_NUMBA = False
+        self.check_against_reference()
+
+    def check_against_reference(self):
+        for seed in range(50):
+            config = Configuration(quiet=True)
+            config.visualisation_enabled = False
+            config.seed = seed
+            config.initial_population = 300
+            config.division_probability = 0.7
+            config.age_limit = 8
+            config.division_limit = 4
+            config.division_cooldown = 1
+            sim = Simulation(config)
+            for tick in range(30):
+                with self.subTest(seed=seed, tick=tick):
+                    alive, ages = sim.alive.copy(), sim.ages.copy()
+                    divisions, last_div = sim.divisions.copy(), sim.last_div.copy()
+                    live = np.flatnonzero(alive)
+                    # Replay the random draws _simulate_tick is about to make.
+                    state = sim.rng.bit_generator.state
+                    divides = sim.rng.random(len(live)) < config.division_probability
+                    picks = sim.rng.random(len(live))
+                    ties = sim.rng.random(len(live))
+                    sim.rng.bit_generator.state = state
+
+                    causes = reference_tick(live, divides, picks, ties, alive, ages, divisions,
+                                            last_div, sim.nbr_flat, config.age_limit,
+                                            config.division_limit, config.division_cooldown)
+                    sim._simulate_tick()
+
+                    np.testing.assert_array_equal(sim._causes, causes)
+                    np.testing.assert_array_equal(sim.alive, alive & (causes == 0))
+                    survivors = sim.alive
+                    np.testing.assert_array_equal(sim.ages[survivors], ages[survivors])
+                    np.testing.assert_array_equal(sim.divisions[survivors], divisions[survivors])
+                    np.testing.assert_array_equal(sim.last_div[survivors], last_div[survivors])
+                    self.assertEqual(sim.alive_count, int(sim.alive.sum()))
+
+
+if __name__ == "__main__":
+    unittest.main()